@@ -1,8 +1,17 @@
 from mcp.server.fastmcp import FastMCP
+import base64
+import binascii
+import bisect
+import heapq
+import itertools
 import math
 import operator
+import re
+import sys
+import time
+from array import array
 from decimal import Decimal, getcontext
-from typing import Any, Dict, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 # Set high precision for decimal operations
 getcontext().prec = 100
@@ -262,3 +271,651 @@ def tan(angle: Union[str, int, float], unit: str = "radians") -> dict:
         return _err(str(e), "VALIDATION_ERROR")
     except Exception as e:
         return _err(f"Tangent error: {str(e)}", "MATH_ERROR")
+
+
+# Array tools accept either a JSON list, base64 packed float64 (little-endian)
+# or newline/comma-delimited text, so large inputs avoid per-element JSON cost.
+ArrayInput = Union[List[Union[int, float]], str]
+ARRAY_ENCODINGS = ("auto", "list", "base64", "text")
+MAX_ARRAY_VALUES = 10_000_000
+# Percentiles sort a Python list (~32 bytes per value), so they get a lower cap
+MAX_PERCENTILE_VALUES = 1_000_000
+MAX_HISTOGRAM_BINS = 10_000
+_TEXT_TOKEN = re.compile(r'[^\s,]+')
+_BASE64_PAYLOAD = re.compile(r'[A-Za-z0-9+/=\s]+')
+
+def _finite_float(value: Union[str, int, float]) -> float:
+    """Convert a single array element, rejecting NaN and infinities"""
+    try:
+        number = float(value) if isinstance(value, str) else float(_safe_convert_number(value))
+    except (ValueError, TypeError, ArithmeticError):
+        raise ValueError(f"Cannot convert '{value}' to number")
+    if not math.isfinite(number):
+        raise ValueError(f"Non-finite value '{value}' is not allowed")
+    return number
+
+def _iter_text_values(text: str) -> Iterator[float]:
+    """Lazily parse newline/comma/whitespace-delimited numbers"""
+    for match in _TEXT_TOKEN.finditer(text):
+        yield _finite_float(match.group())
+
+def _decode_base64_values(text: str, limit: int) -> array:
+    """Decode base64 packed little-endian float64 values (line breaks allowed)"""
+    text = ''.join(text.split())
+    if len(text) // 4 * 3 // 8 > limit:
+        raise ValueError(f"Too many values (max {limit})")
+    try:
+        raw = base64.b64decode(text, validate=True)
+    except (binascii.Error, ValueError):
+        raise ValueError("Invalid base64 payload")
+    if len(raw) % 8:
+        raise ValueError("base64 payload length must be a multiple of 8 bytes (float64)")
+    if len(raw) // 8 > limit:
+        raise ValueError(f"Too many values (max {limit})")
+    arr = array('d')
+    arr.frombytes(raw)
+    if sys.byteorder != 'little':
+        arr.byteswap()
+    if not all(map(math.isfinite, arr)):
+        raise ValueError("Non-finite values (NaN/Infinity) are not allowed")
+    return arr
+
+def _looks_like_text(text: str) -> bool:
+    """Heuristic for encoding="auto": strings starting with a number or using commas are text"""
+    first = _TEXT_TOKEN.search(text)
+    if first is None or ',' in text:
+        return True
+    try:
+        float(first.group())
+        return True
+    except ValueError:
+        return _BASE64_PAYLOAD.fullmatch(text) is None
+
+def _iter_values(values: ArrayInput, encoding: str = "auto", limit: int = MAX_ARRAY_VALUES) -> Iterator[float]:
+    """Yield floats from any supported array encoding, enforcing the size limit"""
+    if encoding not in ARRAY_ENCODINGS:
+        raise ValueError(f"Unsupported encoding '{encoding}' (use one of: {', '.join(ARRAY_ENCODINGS)})")
+    if isinstance(values, (list, tuple)):
+        if encoding not in ("auto", "list"):
+            raise ValueError(f"Encoding '{encoding}' requires a string payload")
+        source: Iterable[float] = (_finite_float(v) for v in values)
+    elif isinstance(values, str):
+        if encoding == "list":
+            raise ValueError("Encoding 'list' requires a JSON array")
+        if encoding == "auto":
+            encoding = "text" if _looks_like_text(values) else "base64"
+        source = _decode_base64_values(values, limit) if encoding == "base64" else _iter_text_values(values)
+    else:
+        raise ValueError("values must be a list of numbers or an encoded string")
+    for count, value in enumerate(source, 1):
+        if count > limit:
+            raise ValueError(f"Too many values (max {limit})")
+        yield value
+
+def _load_array(values: ArrayInput, encoding: str = "auto", limit: int = MAX_ARRAY_VALUES) -> array:
+    """Materialize values into a compact float64 array"""
+    arr = array('d', _iter_values(values, encoding, limit))
+    if not arr:
+        raise ValueError("At least one value is required")
+    return arr
+
+def _running_stats(values: Iterable[float]) -> Dict[str, float]:
+    """One-pass Welford mean/M2 with a Neumaier-compensated sum.
+
+    Overflowed quantities are returned as non-finite; callers check the ones they report.
+    """
+    count = 0
+    mean = m2 = 0.0
+    total = comp = 0.0
+    lo, hi = math.inf, -math.inf
+    for x in values:
+        count += 1
+        delta = x - mean
+        mean += delta / count
+        m2 += delta * (x - mean)
+        if math.isfinite(total):
+            t = total + x
+            if abs(total) >= abs(x):
+                comp += (total - t) + x
+            else:
+                comp += (x - t) + total
+            total = t
+        if x < lo:
+            lo = x
+        if x > hi:
+            hi = x
+    if not count:
+        raise ValueError("At least one value is required")
+    total = total + comp if math.isfinite(total) else math.inf
+    return {"count": count, "sum": total, "mean": mean, "m2": m2, "min": lo, "max": hi}
+
+def _require_finite(value: float, what: str) -> float:
+    if not math.isfinite(value):
+        raise OverflowError(f"{what} overflows float64")
+    return value
+
+def _percentile(sorted_values: array, q: float) -> float:
+    """Linear-interpolated percentile of pre-sorted values (q in [0, 100])"""
+    pos = (len(sorted_values) - 1) * q / 100
+    lower = math.floor(pos)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    frac = pos - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * frac
+
+@mcp.tool()
+def array_sum(values: ArrayInput, encoding: str = "auto") -> dict:
+    """Sum a large array of numbers in one pass with compensated (Neumaier) summation.
+
+    values may be a JSON list, base64 packed little-endian float64, or newline/comma-delimited text.
+    encoding: "auto" (default), "list", "base64" or "text".
+    """
+    try:
+        return _ok(_require_finite(_running_stats(_iter_values(values, encoding))["sum"], "Sum"))
+    except ValueError as e:
+        return _err(str(e), "VALIDATION_ERROR")
+    except OverflowError:
+        return _err("Result too large to compute", "MATH_ERROR")
+    except Exception as e:
+        return _err(f"Array sum error: {str(e)}", "MATH_ERROR")
+
+@mcp.tool()
+def array_mean(values: ArrayInput, encoding: str = "auto") -> dict:
+    """Arithmetic mean of a large array of numbers, computed in one streaming pass."""
+    try:
+        stats = _running_stats(_iter_values(values, encoding))
+        # Prefer the compensated sum; fall back to the Welford mean when the sum overflows
+        mean = stats["sum"] / stats["count"] if math.isfinite(stats["sum"]) else stats["mean"]
+        return _ok(_require_finite(mean, "Mean"))
+    except ValueError as e:
+        return _err(str(e), "VALIDATION_ERROR")
+    except OverflowError:
+        return _err("Result too large to compute", "MATH_ERROR")
+    except Exception as e:
+        return _err(f"Array mean error: {str(e)}", "MATH_ERROR")
+
+@mcp.tool()
+def array_stats(values: ArrayInput, encoding: str = "auto", ddof: int = 0) -> dict:
+    """Count, sum, mean, variance, standard deviation, min and max in one streaming (Welford) pass.
+
+    ddof: delta degrees of freedom for variance (0 = population, 1 = sample).
+    """
+    try:
+        if ddof < 0:
+            return _err("ddof must be non-negative", "VALIDATION_ERROR")
+        stats = _running_stats(_iter_values(values, encoding))
+        if stats["count"] <= ddof:
+            return _err("Not enough values for the requested ddof", "MATH_ERROR")
+        _require_finite(stats["sum"], "Sum")
+        _require_finite(stats["mean"], "Mean")
+        variance = _require_finite(stats["m2"] / (stats["count"] - ddof), "Variance")
+        return _ok({
+            "count": stats["count"],
+            "sum": stats["sum"],
+            "mean": stats["mean"],
+            "variance": variance,
+            "std": math.sqrt(variance),
+            "min": stats["min"],
+            "max": stats["max"],
+        })
+    except ValueError as e:
+        return _err(str(e), "VALIDATION_ERROR")
+    except OverflowError:
+        return _err("Result too large to compute", "MATH_ERROR")
+    except Exception as e:
+        return _err(f"Array statistics error: {str(e)}", "MATH_ERROR")
+
+@mcp.tool()
+def array_variance(values: ArrayInput, encoding: str = "auto", ddof: int = 0) -> dict:
+    """Variance of a large array of numbers using Welford's numerically stable algorithm."""
+    result = array_stats(values, encoding, ddof)
+    if result["ok"]:
+        result["data"]["result"] = result["data"]["result"]["variance"]
+    return result
+
+@mcp.tool()
+def array_percentiles(values: ArrayInput, percentiles: List[Union[int, float]], encoding: str = "auto") -> dict:
+    """Percentiles (0-100, linear interpolation) of an array of numbers.
+
+    Sorting needs the whole input in memory, so at most MAX_PERCENTILE_VALUES (1,000,000) values are accepted.
+
+    Example: percentiles=[50, 90, 99]
+    """
+    try:
+        if not percentiles:
+            return _err("At least one percentile is required", "VALIDATION_ERROR")
+        qs = [_finite_float(q) for q in percentiles]
+        if any(not 0 <= q <= 100 for q in qs):
+            return _err("Percentiles must be between 0 and 100", "VALIDATION_ERROR")
+        sorted_values = array('d', sorted(_load_array(values, encoding, MAX_PERCENTILE_VALUES)))
+        return _ok({f"p{q:g}": _percentile(sorted_values, q) for q in qs})
+    except ValueError as e:
+        return _err(str(e), "VALIDATION_ERROR")
+    except Exception as e:
+        return _err(f"Percentile error: {str(e)}", "MATH_ERROR")
+
+@mcp.tool()
+def array_histogram(
+    values: ArrayInput,
+    bins: int = 10,
+    range_min: Optional[Union[str, int, float]] = None,
+    range_max: Optional[Union[str, int, float]] = None,
+    encoding: str = "auto",
+) -> dict:
+    """Histogram counts over equal-width bins. Values outside [range_min, range_max] are ignored.
+
+    When the range is omitted it defaults to the data min/max.
+    """
+    try:
+        if not 1 <= bins <= MAX_HISTOGRAM_BINS:
+            return _err(f"bins must be between 1 and {MAX_HISTOGRAM_BINS}", "VALIDATION_ERROR")
+        if range_min is None or range_max is None:
+            arr = _load_array(values, encoding)
+            source: Iterable[float] = arr
+            lo = _finite_float(range_min) if range_min is not None else min(arr)
+            hi = _finite_float(range_max) if range_max is not None else max(arr)
+        else:
+            source = _iter_values(values, encoding)
+            lo = _finite_float(range_min)
+            hi = _finite_float(range_max)
+        if hi < lo:
+            return _err("range_max must be >= range_min", "VALIDATION_ERROR")
+        if hi == lo:
+            hi = lo + 1.0
+        width = (hi - lo) / bins
+        if not math.isfinite(width):
+            raise OverflowError("Histogram range overflows float64")
+        edges = [lo + i * width for i in range(bins)] + [hi]
+        counts = array('q', bytes(8 * bins))
+        for x in source:
+            if x < lo or x > hi:
+                continue
+            counts[min(bisect.bisect_right(edges, x) - 1, bins - 1)] += 1
+        return _ok({"edges": edges, "counts": counts.tolist()})
+    except ValueError as e:
+        return _err(str(e), "VALIDATION_ERROR")
+    except OverflowError:
+        return _err("Result too large to compute", "MATH_ERROR")
+    except Exception as e:
+        return _err(f"Histogram error: {str(e)}", "MATH_ERROR")
+
+@mcp.tool()
+def array_dot(a: ArrayInput, b: ArrayInput, encoding: str = "auto") -> dict:
+    """Dot product of two equal-length arrays, computed with extended precision (math.sumprod)."""
+    try:
+        arr_a = _load_array(a, encoding)
+        arr_b = _load_array(b, encoding)
+        if len(arr_a) != len(arr_b):
+            return _err(f"Arrays must have equal length ({len(arr_a)} != {len(arr_b)})", "VALIDATION_ERROR")
+        result = math.sumprod(arr_a, arr_b)
+        if not math.isfinite(result):
+            raise OverflowError("Dot product overflows float64")
+        return _ok(result)
+    except ValueError as e:
+        return _err(str(e), "VALIDATION_ERROR")
+    except OverflowError:
+        return _err("Result too large to compute", "MATH_ERROR")
+    except Exception as e:
+        return _err(f"Dot product error: {str(e)}", "MATH_ERROR")
+
+def _compensated_prefix_sums(values: Iterable[float]) -> Iterator[float]:
+    """Running Neumaier-compensated prefix sums"""
+    total = comp = 0.0
+    for x in values:
+        t = total + x
+        if not math.isfinite(t):
+            raise OverflowError("Sum overflows float64")
+        if abs(total) >= abs(x):
+            comp += (total - t) + x
+        else:
+            comp += (x - t) + total
+        total = t
+        yield total + comp
+
+_CUMULATIVE_OPS = {
+    "sum": operator.add,
+    "prod": operator.mul,
+    "min": min,
+    "max": max,
+}
+
+@mcp.tool()
+def array_cumulative(values: ArrayInput, op: str = "sum", encoding: str = "auto") -> dict:
+    """Cumulative sum, product, min or max of an array (op: "sum", "prod", "min", "max")."""
+    try:
+        func = _CUMULATIVE_OPS.get(op)
+        if func is None:
+            return _err(f"Unsupported op '{op}' (use one of: {', '.join(_CUMULATIVE_OPS)})", "VALIDATION_ERROR")
+        if op == "sum":
+            out = array('d', _compensated_prefix_sums(_iter_values(values, encoding)))
+        else:
+            out = array('d', itertools.accumulate(_iter_values(values, encoding), func))
+        if not out:
+            return _err("At least one value is required", "VALIDATION_ERROR")
+        if not all(map(math.isfinite, out)):
+            raise OverflowError("Cumulative result overflows float64")
+        return _ok(out.tolist())
+    except ValueError as e:
+        return _err(str(e), "VALIDATION_ERROR")
+    except OverflowError:
+        return _err("Result too large to compute", "MATH_ERROR")
+    except Exception as e:
+        return _err(f"Cumulative operation error: {str(e)}", "MATH_ERROR")
+
+
+# Numeric solvers compile the expression once and evaluate it in-process,
+# replacing long chains of calculate/sin/cos round trips with a single call.
+SOLVER_DEFAULT_TIME_LIMIT = 5.0
+SOLVER_MAX_TIME_LIMIT = 30.0
+SOLVER_MAX_ITERATIONS = 10_000
+
+# 7-point Gauss / 15-point Kronrod nodes and weights on [-1, 1]
+_GK15_NODES = (
+    0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245, 0.000000000000000000000000000000000,
+)
+_GK15_KRONROD_WEIGHTS = (
+    0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649, 0.209482141084727828012999174891714,
+)
+_GK15_GAUSS_WEIGHTS = (
+    0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+    0.381830050505118944950369775488975, 0.417959183673469387755102040816327,
+)
+
+class _CompiledFunction:
+    """Single-variable expression compiled once over SAFE_MATH_NAMESPACE"""
+
+    def __init__(self, expression: str, variable: str, time_limit: float):
+        if not expression or not expression.strip():
+            raise ValueError("Expression cannot be empty")
+        if not variable.isidentifier() or variable in SAFE_MATH_NAMESPACE:
+            raise ValueError(f"Invalid variable name '{variable}'")
+        if not 0 < time_limit <= SOLVER_MAX_TIME_LIMIT:
+            raise ValueError(f"time_limit must be in (0, {SOLVER_MAX_TIME_LIMIT}] seconds")
+        try:
+            self._code = compile(expression.strip(), '<string>', 'eval')
+        except SyntaxError as e:
+            raise ValueError(f"Invalid expression syntax: {str(e)}")
+        self._namespace = dict(SAFE_MATH_NAMESPACE)
+        self._variable = variable
+        self._deadline = time.monotonic() + time_limit
+        self.evaluations = 0
+
+    def __call__(self, x: float) -> float:
+        self._namespace[self._variable] = x
+        try:
+            value = eval(self._code, self._namespace)
+        except ZeroDivisionError:
+            raise ValueError(f"Division by zero at {self._variable}={x}")
+        except OverflowError:
+            raise ValueError(f"Expression overflows at {self._variable}={x}")
+        except Exception as e:
+            raise ValueError(f"Evaluation error at {self._variable}={x}: {str(e)}")
+        finally:
+            self.evaluations += 1
+        if isinstance(value, complex) or not isinstance(value, (int, float)):
+            raise ValueError(f"Expression returned non-real value at {self._variable}={x}")
+        try:
+            value = float(value)
+        except OverflowError:
+            raise ValueError(f"Expression overflows at {self._variable}={x}")
+        if not math.isfinite(value):
+            raise ValueError(f"Expression is not finite at {self._variable}={x}")
+        return value
+
+    def map(self, xs: Iterable[float]) -> List[float]:
+        """Evaluate a batch of sample points, checking the time limit once per batch"""
+        self.check_deadline()
+        return [self(x) for x in xs]
+
+    def check_deadline(self) -> None:
+        if time.monotonic() > self._deadline:
+            raise TimeoutError("Solver time limit exceeded")
+
+def _validate_solver_limits(max_iterations: int, tolerance: float) -> None:
+    if not 1 <= max_iterations <= SOLVER_MAX_ITERATIONS:
+        raise ValueError(f"max_iterations must be between 1 and {SOLVER_MAX_ITERATIONS}")
+    if not tolerance > 0:
+        raise ValueError("tolerance must be positive")
+
+def _brent_root(f: _CompiledFunction, a: float, b: float, tol: float, max_iterations: int) -> Dict[str, Any]:
+    """Brent's method (inverse quadratic interpolation / secant / bisection)"""
+    fa, fb = f.map((a, b))
+    if fa == 0:
+        return {"root": a, "error_estimate": 0.0, "iterations": 0, "converged": True}
+    if fb == 0:
+        return {"root": b, "error_estimate": 0.0, "iterations": 0, "converged": True}
+    if (fa > 0) == (fb > 0):
+        raise ValueError("f(lower) and f(upper) must have opposite signs")
+    c, fc = a, fa
+    d = e = b - a
+    for iteration in range(1, max_iterations + 1):
+        f.check_deadline()
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol1 = 2 * sys.float_info.epsilon * abs(b) + 0.5 * tol
+        xm = 0.5 * (c - b)
+        if fb == 0:
+            return {"root": b, "error_estimate": 0.0, "iterations": iteration, "converged": True}
+        if abs(xm) <= tol1:
+            return {"root": b, "error_estimate": abs(xm), "iterations": iteration, "converged": True}
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p, q = 2 * xm * s, 1 - s
+            else:
+                q, r = fa / fc, fb / fc
+                p = s * (2 * xm * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * xm * q - abs(tol1 * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = xm
+        else:
+            d = e = xm
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else math.copysign(tol1, xm)
+        fb = f(b)
+    return {"root": b, "error_estimate": abs(0.5 * (c - b)), "iterations": max_iterations, "converged": False}
+
+def _gauss_kronrod(f: _CompiledFunction, a: float, b: float) -> tuple:
+    """15-point Kronrod estimate and |Kronrod - Gauss| error on [a, b]"""
+    center, half = 0.5 * (a + b), 0.5 * (b - a)
+    points = [center - half * x for x in _GK15_NODES[:-1]] + [center] + [center + half * x for x in reversed(_GK15_NODES[:-1])]
+    values = f.map(points)
+    kronrod = values[7] * _GK15_KRONROD_WEIGHTS[7]
+    gauss = values[7] * _GK15_GAUSS_WEIGHTS[3]
+    for i in range(7):
+        pair = values[i] + values[14 - i]
+        kronrod += _GK15_KRONROD_WEIGHTS[i] * pair
+        if i % 2 == 1:
+            gauss += _GK15_GAUSS_WEIGHTS[i // 2] * pair
+    return kronrod * half, abs((kronrod - gauss) * half)
+
+def _adaptive_quad(f: _CompiledFunction, a: float, b: float, tol: float, max_iterations: int) -> Dict[str, Any]:
+    """Globally adaptive G7-K15 quadrature, bisecting the worst interval first"""
+    if a > b:
+        result = _adaptive_quad(f, b, a, tol, max_iterations)
+        result["integral"] = -result["integral"]
+        return result
+    value, error = _gauss_kronrod(f, a, b)
+    heap = [(-error, a, b, value)]
+    total, total_error = value, error
+    iterations = 1
+    while total_error > max(tol, tol * abs(total)) and iterations < max_iterations:
+        neg_err, lo, hi, v = heapq.heappop(heap)
+        mid = 0.5 * (lo + hi)
+        if mid <= lo or mid >= hi:
+            heapq.heappush(heap, (neg_err, lo, hi, v))
+            break
+        left, left_err = _gauss_kronrod(f, lo, mid)
+        right, right_err = _gauss_kronrod(f, mid, hi)
+        heapq.heappush(heap, (-left_err, lo, mid, left))
+        heapq.heappush(heap, (-right_err, mid, hi, right))
+        iterations += 1
+        total += left + right - v
+        total_error += left_err + right_err + neg_err
+    total = math.fsum(item[3] for item in heap)
+    total_error = math.fsum(-item[0] for item in heap)
+    return {
+        "integral": total,
+        "error_estimate": total_error,
+        "iterations": iterations,
+        "subintervals": len(heap),
+        "converged": total_error <= max(tol, tol * abs(total)),
+    }
+
+def _brent_minimize(f: _CompiledFunction, a: float, b: float, tol: float, max_iterations: int) -> Dict[str, Any]:
+    """Brent's bounded minimization (golden section with parabolic steps)"""
+    golden = 0.5 * (3 - math.sqrt(5))
+    x = w = v = a + golden * (b - a)
+    fx = fw = fv = f(x)
+    d = e = 0.0
+    for iteration in range(1, max_iterations + 1):
+        f.check_deadline()
+        xm = 0.5 * (a + b)
+        tol1 = math.sqrt(sys.float_info.epsilon) * abs(x) + tol / 3
+        tol2 = 2 * tol1
+        if abs(x - xm) <= tol2 - 0.5 * (b - a):
+            return {"x": x, "value": fx, "error_estimate": 0.5 * (b - a), "iterations": iteration, "converged": True}
+        use_golden = True
+        if abs(e) > tol1:
+            r = (x - w) * (fx - fv)
+            q = (x - v) * (fx - fw)
+            p = (x - v) * q - (x - w) * r
+            q = 2 * (q - r)
+            if q > 0:
+                p = -p
+            q = abs(q)
+            if abs(p) < abs(0.5 * q * e) and q * (a - x) < p < q * (b - x):
+                e, d = d, p / q
+                u = x + d
+                if u - a < tol2 or b - u < tol2:
+                    d = math.copysign(tol1, xm - x)
+                use_golden = False
+        if use_golden:
+            e = (a if x >= xm else b) - x
+            d = golden * e
+        u = x + (d if abs(d) >= tol1 else math.copysign(tol1, d))
+        fu = f(u)
+        if fu <= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, fv, w, fw, x, fx = w, fw, x, fx, u, fu
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu <= fw or w == x:
+                v, fv, w, fw = w, fw, u, fu
+            elif fu <= fv or v == x or v == w:
+                v, fv = u, fu
+    return {"x": x, "value": fx, "error_estimate": 0.5 * (b - a), "iterations": max_iterations, "converged": False}
+
+def _parse_bound(value: Union[str, int, float]) -> float:
+    """Numeric bound, also accepting constant expressions such as pi/2"""
+    if isinstance(value, str):
+        value = _evaluate_expression(value.strip())
+    if isinstance(value, complex) or not isinstance(value, (int, float)):
+        raise ValueError(f"Bound must be a real number, got {value!r}")
+    try:
+        return float(value)
+    except OverflowError:
+        raise ValueError("Bound is too large to represent as a float")
+
+def _run_solver(solver, expression: str, variable: str, lower, upper, tolerance: float,
+                max_iterations: int, time_limit: float, label: str, ordered: bool = True) -> dict:
+    """Shared validation, compilation and error mapping for the numeric solvers"""
+    try:
+        _validate_solver_limits(max_iterations, tolerance)
+        lo = _parse_bound(lower)
+        hi = _parse_bound(upper)
+        if not (math.isfinite(lo) and math.isfinite(hi)):
+            return _err("Bounds must be finite", "VALIDATION_ERROR")
+        if ordered and lo >= hi:
+            return _err("lower must be less than upper", "VALIDATION_ERROR")
+        f = _CompiledFunction(expression, variable, time_limit)
+    except (ValueError, ArithmeticError, TypeError) as e:
+        return _err(str(e), "VALIDATION_ERROR")
+    try:
+        result = solver(f, lo, hi, tolerance, max_iterations)
+        result["evaluations"] = f.evaluations
+        return _ok(result)
+    except TimeoutError as e:
+        return _err(str(e), "TIMEOUT_ERROR")
+    except ValueError as e:
+        return _err(str(e), "MATH_ERROR")
+    except Exception as e:
+        return _err(f"{label} error: {str(e)}", "INTERNAL_ERROR")
+
+@mcp.tool()
+def solve_root(
+    expression: str,
+    lower: Union[str, int, float],
+    upper: Union[str, int, float],
+    variable: str = "x",
+    tolerance: float = 1e-12,
+    max_iterations: int = 200,
+    time_limit: float = SOLVER_DEFAULT_TIME_LIMIT,
+) -> dict:
+    """Find a root of expression(variable) = 0 in [lower, upper] using Brent's method.
+
+    The expression is compiled once and may use any function available to calculate.
+    Bounds may be numbers or constant expressions (e.g. "pi/2").
+    f(lower) and f(upper) must have opposite signs.
+
+    Example: expression="cos(x) - x", lower=0, upper=1
+    """
+    return _run_solver(_brent_root, expression, variable, lower, upper,
+                       tolerance, max_iterations, time_limit, "Root finding")
+
+@mcp.tool()
+def integrate(
+    expression: str,
+    lower: Union[str, int, float],
+    upper: Union[str, int, float],
+    variable: str = "x",
+    tolerance: float = 1e-10,
+    max_iterations: int = 500,
+    time_limit: float = SOLVER_DEFAULT_TIME_LIMIT,
+) -> dict:
+    """Definite integral of expression(variable) over [lower, upper] using adaptive Gauss-Kronrod (G7-K15) quadrature.
+
+    tolerance is applied as both absolute and relative error target; max_iterations bounds interval bisections.
+    If lower > upper the integral is taken with the opposite sign.
+
+    Example: expression="sin(x)**2", lower=0, upper="pi"
+    """
+    return _run_solver(_adaptive_quad, expression, variable, lower, upper,
+                       tolerance, max_iterations, time_limit, "Integration", ordered=False)
+
+@mcp.tool()
+def minimize(
+    expression: str,
+    lower: Union[str, int, float],
+    upper: Union[str, int, float],
+    variable: str = "x",
+    tolerance: float = 1e-10,
+    max_iterations: int = 500,
+    time_limit: float = SOLVER_DEFAULT_TIME_LIMIT,
+) -> dict:
+    """Find a local minimum of expression(variable) on [lower, upper] using Brent's bounded method.
+
+    Example: expression="(x - 2)**2 + 1", lower=0, upper=5
+    """
+    return _run_solver(_brent_minimize, expression, variable, lower, upper,
+                       tolerance, max_iterations, time_limit, "Minimization")
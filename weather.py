@@ -1,5 +1,8 @@
+import math
+import time
+from array import array
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 from mcp.server.fastmcp import FastMCP
@@ -11,6 +14,17 @@ mcp_weather = FastMCP(name="weather", stateless_http=True)
 GEOCODE_API = "https://geocoding-api.open-meteo.com/v1/search"
 FORECAST_API = "https://api.open-meteo.com/v1/forecast"
 
+# Open-Meteo refreshes its forecast models on an hourly cadence, so cached
+# columns expire at the next hour boundary rather than a sliding window.
+FORECAST_MODEL_INTERVAL = 3600
+FORECAST_CACHE_MAX_ENTRIES = 256
+FORECAST_AGGREGATIONS = ("mean", "min", "max")
+
+DEFAULT_HOURLY = ["temperature_2m", "relative_humidity_2m", "wind_speed_10m", "precipitation"]
+DEFAULT_DAILY = ["temperature_2m_max", "temperature_2m_min", "precipitation_sum"]
+
+_forecast_cache: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = {}
+
 
 def _http_client(timeout: float = 20.0) -> httpx.Client:
     return httpx.Client(timeout=timeout)
@@ -95,3 +109,198 @@ def weather_by_coords(latitude: float, longitude: float) -> Dict[str, Any]:
         return _err(str(e), code="HTTP_ERROR")
 
 
+def _next_model_run(now: float) -> float:
+    return (math.floor(now / FORECAST_MODEL_INTERVAL) + 1) * FORECAST_MODEL_INTERVAL
+
+
+def _to_columns(block: Dict[str, Any], variables: List[str]) -> Dict[str, array]:
+    """Pack an Open-Meteo hourly/daily block into typed arrays (NaN for gaps)."""
+    columns: Dict[str, array] = {"time": array("q", block.get("time") or [])}
+    for name in variables:
+        values = block.get(name) or []
+        columns[name] = array("d", (math.nan if v is None else float(v) for v in values))
+    return columns
+
+
+def _fetch_forecast_columns(
+    latitude: float,
+    longitude: float,
+    hourly: Tuple[str, ...],
+    daily: Tuple[str, ...],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    forecast_days: Optional[int],
+    timezone: str,
+) -> Tuple[Dict[str, Any], bool]:
+    key = (round(latitude, 4), round(longitude, 4), hourly, daily, start_date, end_date, forecast_days, timezone)
+    now = time.time()
+    cached = _forecast_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1], True
+
+    params: Dict[str, Any] = {
+        "latitude": latitude,
+        "longitude": longitude,
+        "timezone": timezone,
+        "timeformat": "unixtime",
+    }
+    if hourly:
+        params["hourly"] = list(hourly)
+    if daily:
+        params["daily"] = list(daily)
+    if start_date or end_date:
+        params["start_date"] = start_date
+        params["end_date"] = end_date
+    elif forecast_days is not None:
+        params["forecast_days"] = forecast_days
+
+    with _http_client() as client:
+        r = client.get(FORECAST_API, params=params)
+        r.raise_for_status()
+        data = r.json()
+
+    entry = {
+        "timezone": data.get("timezone", timezone),
+        "utc_offset_seconds": data.get("utc_offset_seconds", 0),
+        "hourly": _to_columns(data.get("hourly") or {}, list(hourly)) if hourly else None,
+        "daily": _to_columns(data.get("daily") or {}, list(daily)) if daily else None,
+        "hourly_units": data.get("hourly_units") or {},
+        "daily_units": data.get("daily_units") or {},
+    }
+    if len(_forecast_cache) >= FORECAST_CACHE_MAX_ENTRIES:
+        for stale in [k for k, (exp, _) in _forecast_cache.items() if exp <= now] or [next(iter(_forecast_cache))]:
+            _forecast_cache.pop(stale, None)
+    _forecast_cache[key] = (_next_model_run(now), entry)
+    return entry, False
+
+
+def _downsample(columns: Dict[str, array], window: int, aggregations: List[str]) -> Dict[str, Any]:
+    """Aggregate each column over fixed windows in a single pass, skipping NaN gaps."""
+    times = columns["time"]
+    if window <= 1:
+        return {name: col.tolist() for name, col in columns.items()}
+
+    out: Dict[str, Any] = {"time": array("q", times[::window]).tolist()}
+    for name, col in columns.items():
+        if name == "time":
+            continue
+        stats = {agg: array("d") for agg in aggregations}
+        for start in range(0, len(col), window):
+            total, count = 0.0, 0
+            lo, hi = math.inf, -math.inf
+            for v in col[start:start + window]:
+                if v != v:
+                    continue
+                total += v
+                count += 1
+                if v < lo:
+                    lo = v
+                if v > hi:
+                    hi = v
+            if not count:
+                for agg in aggregations:
+                    stats[agg].append(math.nan)
+                continue
+            if "mean" in stats:
+                stats["mean"].append(total / count)
+            if "min" in stats:
+                stats["min"].append(lo)
+            if "max" in stats:
+                stats["max"].append(hi)
+        for agg, values in stats.items():
+            key = name if len(aggregations) == 1 else f"{name}_{agg}"
+            out[key] = values.tolist()
+    return out
+
+
+def _downsampled_units(units: Dict[str, Any], window: int, aggregations: List[str]) -> Dict[str, Any]:
+    """Rename unit keys to match the column names produced by _downsample."""
+    if window <= 1 or len(aggregations) == 1:
+        return dict(units)
+    out: Dict[str, Any] = {}
+    for name, unit in units.items():
+        if name == "time":
+            out[name] = unit
+            continue
+        for agg in aggregations:
+            out[f"{name}_{agg}"] = unit
+    return out
+
+
+def _json_safe(columns: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        name: [None if isinstance(v, float) and v != v else v for v in values]
+        for name, values in columns.items()
+    }
+
+
+@mcp_weather.tool()
+def weather_forecast(
+    latitude: float,
+    longitude: float,
+    hourly: Optional[List[str]] = None,
+    daily: Optional[List[str]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    forecast_days: Optional[int] = 7,
+    timezone: str = "UTC",
+    window: int = 1,
+    aggregations: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Get an hourly/daily forecast by coordinates as columnar arrays.
+
+    Args:
+        latitude: Latitude of the location.
+        longitude: Longitude of the location.
+        hourly: Open-Meteo hourly variables (default temperature, humidity, wind, precipitation).
+            Pass an empty list to skip hourly data.
+        daily: Open-Meteo daily variables (default max/min temperature, precipitation sum).
+            Pass an empty list to skip daily data.
+        start_date: Optional start date (YYYY-MM-DD); requires end_date.
+        end_date: Optional end date (YYYY-MM-DD); requires start_date.
+        forecast_days: Number of days to forecast when no date range is given (1-16).
+        timezone: IANA timezone for the returned timestamps (default 'UTC').
+        window: Number of hourly steps to aggregate into one value (default 1, no downsampling).
+            Only the hourly block is downsampled; daily data is returned as-is.
+        aggregations: Per-window aggregations among 'mean', 'min', 'max' (default ['mean']).
+
+    Each block is returned as {"time": [...unix seconds], "<variable>": [...]}.
+    With several aggregations, hourly columns and their units are named "<variable>_<aggregation>".
+    """
+    hourly_vars = tuple(DEFAULT_HOURLY if hourly is None else hourly)
+    daily_vars = tuple(DEFAULT_DAILY if daily is None else daily)
+    aggs = list(aggregations or ["mean"])
+    if not hourly_vars and not daily_vars:
+        return _err("at least one hourly or daily variable is required", code="VALIDATION_ERROR")
+    if bool(start_date) != bool(end_date):
+        return _err("start_date and end_date must be given together", code="VALIDATION_ERROR")
+    if forecast_days is not None and not 1 <= forecast_days <= 16:
+        return _err("forecast_days must be between 1 and 16", code="VALIDATION_ERROR")
+    if window < 1:
+        return _err("window must be >= 1", code="VALIDATION_ERROR")
+    unknown = [a for a in aggs if a not in FORECAST_AGGREGATIONS]
+    if unknown:
+        return _err(f"unsupported aggregations: {', '.join(unknown)}", code="VALIDATION_ERROR")
+    try:
+        entry, cache_hit = _fetch_forecast_columns(
+            latitude, longitude, hourly_vars, daily_vars, start_date, end_date, forecast_days, timezone
+        )
+        data: Dict[str, Any] = {
+            "lat": latitude,
+            "lon": longitude,
+            "timezone": entry["timezone"],
+            "utc_offset_seconds": entry["utc_offset_seconds"],
+        }
+        if entry["hourly"] is not None:
+            data["hourly"] = _json_safe(_downsample(entry["hourly"], window, aggs))
+            data["hourly_units"] = _downsampled_units(entry["hourly_units"], window, aggs)
+        if entry["daily"] is not None:
+            data["daily"] = _json_safe(_downsample(entry["daily"], 1, aggs))
+            data["daily_units"] = entry["daily_units"]
+        return _ok(data, meta={
+            "cached": cache_hit,
+            "hourly_window": window,
+            "hourly_aggregations": aggs if window > 1 else [],
+        })
+    except httpx.HTTPError as e:
+        return _err(str(e), code="HTTP_ERROR")